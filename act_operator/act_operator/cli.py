@@ -11,6 +11,7 @@ from rich.table import Table
 
 from .utils import (
     CASTS_DIR,
+    ENCODING_UTF8,
     LANGGRAPH_FILE,
     PYPROJECT_FILE,
     Language,
@@ -28,7 +29,6 @@ SCAFFOLD_DIR = "scaffold"
 BASE_NODE_FILE = "base_node.py"
 BASE_GRAPH_FILE = "base_graph.py"
 DEFAULT_LANGUAGE_CHOICE = 1
-ENCODING_UTF8 = "utf-8"
 
 console = Console()
 app = typer.Typer(help="Act Operator", invoke_without_command=True)
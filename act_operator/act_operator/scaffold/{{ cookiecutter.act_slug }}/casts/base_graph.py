@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any
 
+from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 
@@ -13,9 +16,15 @@ class BaseGraph(ABC):
         name: Canonical name of the graph (class name by default).
     """
 
+    name: str = "BaseGraph"
+
     def __init__(self) -> None:
-        """Initializes the graph and assigns its canonical name."""
-        self.name = self.__class__.__name__
+        """Initializes the graph with an empty compiled-graph cache."""
+        self._compiled: CompiledStateGraph | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
 
     @abstractmethod
     def build(self) -> CompiledStateGraph:
@@ -32,10 +41,45 @@ class BaseGraph(ABC):
         """
         raise NotImplementedError
 
+    def add_parallel_nodes(
+        self,
+        builder: StateGraph,
+        nodes: Mapping[str, Any],
+        *,
+        source: str = START,
+        target: str = END,
+    ) -> None:
+        """Adds independent nodes that run in parallel between two points.
+
+        Every node gets an edge from ``source`` and an edge to ``target``.
+        LangGraph runs all destinations of a node in the same super-step, so
+        the branches execute concurrently and ``target`` runs once all of them
+        have finished.
+
+        Args:
+            builder: Graph builder to register the nodes on.
+            nodes: Node names mapped to node instances (or callables).
+            source: Node the branches fan out from.
+            target: Node the branches join into.
+        """
+        for name, node in nodes.items():
+            builder.add_node(name, node)
+            builder.add_edge(source, name)
+            builder.add_edge(name, target)
+
+    def invalidate(self) -> None:
+        """Drops the cached compiled graph so the next call rebuilds it."""
+        self._compiled = None
+
     def __call__(self) -> CompiledStateGraph:
         """Compiles the graph when invoked like a function.
 
+        The compiled graph is built once and reused by later calls; call
+        :meth:`invalidate` after changing the graph definition.
+
         Returns:
             CompiledStateGraph: Result returned by :meth:`build`.
         """
-        return self.build()
+        if self._compiled is None:
+            self._compiled = self.build()
+        return self._compiled
@@ -10,6 +10,7 @@ Classes:
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping, Optional
@@ -26,8 +27,12 @@ LOGGER = logging.getLogger(__name__)
 _ALLOWED_PARAMS = frozenset({"config", "runtime"})
 
 
-def _validate_execute(cls: type, *, expect_async: bool) -> None:
-    """Validate that a class defines a proper execute implementation."""
+def _validate_execute(cls: type, *, expect_async: bool) -> frozenset[str]:
+    """Validate that a class defines a proper execute implementation.
+
+    Returns the optional parameters declared by ``execute()`` so that
+    ``__call__`` does not need to inspect the signature on every invocation.
+    """
     try:
         execute_attr = inspect.getattr_static(cls, "execute")
     except AttributeError as e:
@@ -65,14 +70,15 @@ def _validate_execute(cls: type, *, expect_async: bool) -> None:
                 f"{', '.join(sorted(_ALLOWED_PARAMS))}. Got '{param.name}'."
             )
 
+    return frozenset(param.name for param in params[1:])
+
 
 def _build_kwargs(
-    execute_fn: Callable[..., Any],
+    params: frozenset[str],
     config: Any,
     runtime: Any,
 ) -> dict[str, Any]:
-    """Build kwargs dict for execute() based on its signature."""
-    params = inspect.signature(execute_fn).parameters
+    """Build kwargs dict for execute() from its precomputed optional params."""
     kwargs: dict[str, Any] = {}
 
     if "config" in params:
@@ -96,6 +102,10 @@ class BaseNode:
         def execute(self, state, runtime): ...
         def execute(self, state, config, runtime): ...
 
+    ``verbose`` lives in a slot and ``name`` on the class, so base instances
+    carry no ``__dict__``. Subclasses get one unless they also declare
+    ``__slots__`` for their own attributes.
+
     Attributes:
         name: Canonical name of the node (class name by default).
         verbose: Flag indicating whether detailed logging is enabled.
@@ -106,17 +116,21 @@ class BaseNode:
         ...         return {"processed": state["input"].upper()}
     """
 
+    __slots__ = ("verbose",)
+
+    name: str = "BaseNode"
     execute: Callable[..., dict]
+    _execute_params: frozenset[str] = frozenset()
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.name = self.__class__.__name__
-        self.verbose = kwargs.get("verbose", False)
+    def __init__(self, *, verbose: bool = False) -> None:
+        self.verbose = verbose
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
         if cls is BaseNode or inspect.isabstract(cls):
             return
-        _validate_execute(cls, expect_async=False)
+        cls._execute_params = _validate_execute(cls, expect_async=False)
 
     def __call__(
         self,
@@ -128,7 +142,7 @@ class BaseNode:
         if self.verbose:
             LOGGER.debug("[%s] Executing", self.name)
 
-        kwargs = _build_kwargs(self.execute, config, runtime)
+        kwargs = _build_kwargs(self._execute_params, config, runtime)
         result = self.execute(state, **kwargs)
 
         if not isinstance(result, dict):
@@ -141,9 +155,23 @@ class BaseNode:
 
         return result
 
+    async def acall(
+        self,
+        state: Any,
+        config: Optional[RunnableConfig] = None,
+        runtime: Optional[Runtime] = None,
+    ) -> dict:
+        """Invoke the node from async code without blocking the event loop.
+
+        The synchronous ``execute`` runs in a worker thread. Nodes whose work
+        is natively asynchronous should subclass ``AsyncBaseNode`` instead.
+        """
+        return await asyncio.to_thread(self, state, config, runtime)
+
     def log(self, message: str, **context: Any) -> None:
         """Log a debug message when verbose mode is enabled."""
-        if not self.verbose:
+        # Skip walking the context entirely unless the records would be emitted
+        if not self.verbose or not LOGGER.isEnabledFor(logging.DEBUG):
             return
         LOGGER.debug("[%s] %s", self.name, message)
         for key, value in context.items():
@@ -169,7 +197,7 @@ class AsyncBaseNode:
     """Base class for asynchronous nodes in LangGraph graphs.
 
     Async subclasses must implement ``async def execute`` following the same
-    signature rules as ``BaseNode``.
+    signature and ``__slots__`` rules as ``BaseNode``.
 
     Supported execute signatures::
 
@@ -189,17 +217,21 @@ class AsyncBaseNode:
         ...         return {"data": result}
     """
 
+    __slots__ = ("verbose",)
+
+    name: str = "AsyncBaseNode"
     execute: Callable[..., Awaitable[dict]]
+    _execute_params: frozenset[str] = frozenset()
 
-    def __init__(self, **kwargs: Any) -> None:
-        self.name = self.__class__.__name__
-        self.verbose = kwargs.get("verbose", False)
+    def __init__(self, *, verbose: bool = False) -> None:
+        self.verbose = verbose
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
         if cls is AsyncBaseNode or inspect.isabstract(cls):
             return
-        _validate_execute(cls, expect_async=True)
+        cls._execute_params = _validate_execute(cls, expect_async=True)
 
     async def __call__(
         self,
@@ -211,7 +243,7 @@ class AsyncBaseNode:
         if self.verbose:
             LOGGER.debug("[%s] Executing", self.name)
 
-        kwargs = _build_kwargs(self.execute, config, runtime)
+        kwargs = _build_kwargs(self._execute_params, config, runtime)
         result = await self.execute(state, **kwargs)
 
         if not isinstance(result, dict):
@@ -226,7 +258,8 @@ class AsyncBaseNode:
 
     def log(self, message: str, **context: Any) -> None:
         """Log a debug message when verbose mode is enabled."""
-        if not self.verbose:
+        # Skip walking the context entirely unless the records would be emitted
+        if not self.verbose or not LOGGER.isEnabledFor(logging.DEBUG):
             return
         LOGGER.debug("[%s] %s", self.name, message)
         for key, value in context.items():
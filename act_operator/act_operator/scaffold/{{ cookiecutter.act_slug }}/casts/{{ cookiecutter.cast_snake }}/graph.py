@@ -8,6 +8,7 @@ Overview:
 Guidelines:
     1. Call ``builder.add_node()`` with custom node classes.
     2. Connect nodes via ``builder.add_edge()`` or ``builder.add_conditional_edges()`` when branching.
+       Independent nodes can run in parallel via ``self.add_parallel_nodes()``.
     3. Return the compiled graph to orchestrate LangGraph execution.
 
 Official document URL: 
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import json
+import os
+import tomllib
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from act_operator import utils
+from act_operator.utils import (
+    build_name_variants,
+    register_cast,
+    render_cookiecutter_cast_subproject,
+    render_cookiecutter_template,
+    render_many,
+    update_langgraph_registry,
+    update_workspace_members,
+)
+
+
+def _fake_run_cookiecutter(
+    template_dir: Path, context: dict[str, Any], output_dir: Path
+) -> Path:
+    """Stand-in for cookiecutter: renders only the cast directory."""
+    rendered = output_dir / "act"
+    cast_dir = rendered / "casts" / context["cast_snake"]
+    cast_dir.mkdir(parents=True)
+    (cast_dir / "graph.py").write_text(f"# {context['cast_snake']}\n")
+    return rendered
+
+
+@pytest.mark.parametrize(
+    ("raw", "slug", "snake", "title", "pascal"),
+    [
+        ("mycast", "mycast", "mycast", "Mycast", "Mycast"),
+        ("My Project", "my-project", "my_project", "My Project", "MyProject"),
+        ("  sample_act  ", "sample-act", "sample_act", "Sample Act", "SampleAct"),
+        ("a__b--c", "a-b-c", "a_b_c", "A B C", "ABC"),
+        ("cast2x agent", "cast2x-agent", "cast2x_agent", "Cast2X Agent", "Cast2XAgent"),
+        ("a" + "-" * 10_000 + "b", "a-b", "a_b", "A B", "AB"),
+    ],
+)
+def test_build_name_variants(
+    raw: str, slug: str, snake: str, title: str, pascal: str
+) -> None:
+    variants = build_name_variants(raw)
+
+    assert variants.raw == raw.strip()
+    assert variants.slug == slug
+    assert variants.snake == snake
+    assert variants.title == title
+    assert variants.pascal == pascal
+
+
+@pytest.mark.parametrize(
+    "raw", ["", "   ", "1cast", "my#cast", "_cast", "-" * 10_000 + "a"]
+)
+def test_build_name_variants_rejects_invalid_names(raw: str) -> None:
+    with pytest.raises(ValueError):
+        build_name_variants(raw)
+
+
+def test_build_name_variants_is_memoized() -> None:
+    first = build_name_variants("Cached Cast")
+
+    assert build_name_variants("  Cached Cast ") is first
+
+
+def test_update_langgraph_registry_adds_graph(tmp_path: Path) -> None:
+    langgraph = tmp_path / "langgraph.json"
+    langgraph.write_text('{"dependencies": ["."], "graphs": {}, "env": ".env"}')
+
+    update_langgraph_registry(langgraph, "new-cast", "new_cast")
+
+    assert langgraph.read_text(encoding="utf-8") == (
+        "{\n"
+        '  "dependencies": [\n'
+        '    "."\n'
+        "  ],\n"
+        '  "graphs": {\n'
+        '    "new-cast": "./casts/new_cast/graph.py:new_cast_graph"\n'
+        "  },\n"
+        '  "env": ".env"\n'
+        "}\n"
+    )
+
+
+def test_update_langgraph_registry_keeps_existing_file(tmp_path: Path) -> None:
+    langgraph = tmp_path / "langgraph.json"
+    original = '{"graphs": {"new-cast": "./custom.py:graph"}}'
+    langgraph.write_text(original)
+
+    update_langgraph_registry(langgraph, "new-cast", "new_cast")
+
+    assert langgraph.read_text() == original
+
+
+def test_update_workspace_members_inserts_sorted_line(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[tool.uv.workspace]\nmembers = [\n    "casts/a",\n    "casts/c",\n]\n'
+    )
+
+    update_workspace_members(pyproject, "casts/b")
+
+    assert pyproject.read_text(encoding="utf-8") == (
+        '[tool.uv.workspace]\nmembers = [\n    "casts/a",\n    "casts/b",\n'
+        '    "casts/c",\n]\n'
+    )
+
+
+def test_update_workspace_members_ignores_commented_entry(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[tool.uv.workspace]\nmembers = [\n    # "casts/foo",\n    "casts/bar",\n]\n'
+    )
+
+    update_workspace_members(pyproject, "casts/foo")
+
+    content = pyproject.read_text(encoding="utf-8")
+    assert tomllib.loads(content)["tool"]["uv"]["workspace"]["members"] == [
+        "casts/bar",
+        "casts/foo",
+    ]
+
+
+def test_update_workspace_members_keeps_line_endings_consistent(
+    tmp_path: Path,
+) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_bytes(
+        b'[tool.uv.workspace]\r\nmembers = [\r\n    "casts/a",\r\n]\r\n'
+    )
+
+    update_workspace_members(pyproject, "casts/b")
+
+    raw = pyproject.read_bytes()
+    assert raw.count(b"\r\n") in (0, raw.count(b"\n"))
+    assert b'"casts/b"' in raw
+
+
+def test_update_workspace_members_rewrites_inline_array(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.uv.workspace]\nmembers = ["casts/*"]\n')
+
+    update_workspace_members(pyproject, "casts/new_cast")
+
+    assert pyproject.read_text(encoding="utf-8") == (
+        '[tool.uv.workspace]\nmembers = [\n    "casts/*",\n    "casts/new_cast",\n]\n'
+    )
+
+
+def test_render_template_skips_rename_for_relative_target(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_run(template_dir: Path, context: dict[str, Any], output_dir: Path) -> Path:
+        rendered = output_dir.absolute() / "my-act"
+        rendered.mkdir()
+        return rendered
+
+    def fail_replace(*args: Any) -> None:
+        raise AssertionError("unexpected rename")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(utils, "_run_cookiecutter", fake_run)
+    monkeypatch.setattr(utils.os, "replace", fail_replace)
+
+    render_cookiecutter_template(tmp_path, Path("my-act"), {})
+
+    assert (tmp_path / "my-act").is_dir()
+
+
+def test_render_cast_subproject_replaces_existing_cast(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(utils, "_run_cookiecutter", _fake_run_cookiecutter)
+    target = tmp_path / "casts" / "my_cast"
+    target.mkdir(parents=True)
+    (target / "stale.py").write_text("")
+
+    render_cookiecutter_cast_subproject(tmp_path, target, {"cast_snake": "my_cast"})
+
+    assert sorted(path.name for path in target.iterdir()) == ["graph.py"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["casts"]
+
+
+@pytest.mark.parametrize("failing_step", ["move", "post_process"])
+def test_render_cast_subproject_keeps_existing_cast_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failing_step: str
+) -> None:
+    def fail(*args: Any) -> None:
+        raise OSError("boom")
+
+    monkeypatch.setattr(utils, "_run_cookiecutter", _fake_run_cookiecutter)
+    if failing_step == "move":
+        monkeypatch.setattr(utils, "_move_cast_to_target", fail)
+    target = tmp_path / "casts" / "my_cast"
+    target.mkdir(parents=True)
+    (target / "keep.py").write_text("kept")
+
+    with pytest.raises(OSError, match="boom"):
+        render_cookiecutter_cast_subproject(
+            tmp_path,
+            target,
+            {"cast_snake": "my_cast"},
+            post_process=fail if failing_step == "post_process" else None,
+        )
+
+    assert sorted(path.name for path in target.iterdir()) == ["keep.py"]
+    assert (target / "keep.py").read_text() == "kept"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["casts"]
+
+
+def test_render_cast_subproject_removes_partial_cast_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(rendered_path: Path) -> None:
+        raise OSError("boom")
+
+    monkeypatch.setattr(utils, "_run_cookiecutter", _fake_run_cookiecutter)
+    target = tmp_path / "casts" / "my_cast"
+
+    with pytest.raises(OSError, match="boom"):
+        render_cookiecutter_cast_subproject(
+            tmp_path, target, {"cast_snake": "my_cast"}, post_process=fail
+        )
+
+    assert not target.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["casts"]
+
+
+def test_render_cast_subproject_keeps_scratch_when_restore_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    real_replace = os.replace
+
+    def replace(src: Path, dst: Path) -> None:
+        if Path(src).name == ".previous":
+            raise PermissionError("locked")
+        real_replace(src, dst)
+
+    def fail(rendered_path: Path) -> None:
+        raise OSError("boom")
+
+    monkeypatch.setattr(utils, "_run_cookiecutter", _fake_run_cookiecutter)
+    monkeypatch.setattr(utils.os, "replace", replace)
+    target = tmp_path / "casts" / "my_cast"
+    target.mkdir(parents=True)
+    (target / "keep.py").write_text("kept")
+
+    with pytest.raises(OSError, match="boom") as excinfo:
+        render_cookiecutter_cast_subproject(
+            tmp_path, target, {"cast_snake": "my_cast"}, post_process=fail
+        )
+
+    (scratch,) = tmp_path.glob(".act_op_*")
+    previous = scratch / ".previous"
+    assert (previous / "keep.py").read_text() == "kept"
+    assert str(previous) in "\n".join(excinfo.value.__notes__)
+
+
+def test_render_many_renders_inline_on_single_cpu(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(utils, "_run_cookiecutter", _fake_run_cookiecutter)
+    casts_dir = tmp_path / "casts"
+    specs = [
+        (tmp_path, casts_dir / name, {"cast_snake": name})
+        for name in ("first_cast", "second_cast")
+    ]
+
+    render_many(specs)
+
+    assert sorted(path.name for path in casts_dir.iterdir()) == [
+        "first_cast",
+        "second_cast",
+    ]
+    assert (casts_dir / "second_cast" / "graph.py").read_text() == "# second_cast\n"
+
+
+def test_render_many_rejects_duplicate_targets(tmp_path: Path) -> None:
+    target = tmp_path / "casts" / "cast"
+    specs = [
+        (tmp_path, target, {"cast_snake": "cast"}),
+        (tmp_path, target, {"cast_snake": "cast"}),
+    ]
+
+    with pytest.raises(ValueError):
+        render_many(specs)
+
+
+def _write_act_files(root: Path, members: str, graphs: str) -> tuple[Path, Path]:
+    pyproject = root / "pyproject.toml"
+    pyproject.write_text(f"[tool.uv.workspace]\nmembers = [{members}]\n")
+    langgraph = root / "langgraph.json"
+    langgraph.write_text(f'{{"graphs": {{{graphs}}}}}')
+    return pyproject, langgraph
+
+
+def test_register_cast_updates_both_files(tmp_path: Path) -> None:
+    pyproject, langgraph = _write_act_files(tmp_path, "", "")
+
+    register_cast(pyproject, langgraph, "new-cast", "new_cast")
+
+    assert pyproject.read_text(encoding="utf-8") == (
+        '[tool.uv.workspace]\nmembers = [\n    "casts/new_cast",\n]\n'
+    )
+    assert json.loads(langgraph.read_text(encoding="utf-8")) == {
+        "graphs": {"new-cast": "./casts/new_cast/graph.py:new_cast_graph"}
+    }
+
+
+def test_register_cast_skips_writes_when_already_registered(tmp_path: Path) -> None:
+    pyproject, langgraph = _write_act_files(
+        tmp_path, '"casts/new_cast"', '"new-cast": "./custom.py:graph"'
+    )
+    before = (pyproject.stat().st_mtime_ns, langgraph.stat().st_mtime_ns)
+    contents = (pyproject.read_text(), langgraph.read_text())
+
+    register_cast(pyproject, langgraph, "new-cast", "new_cast")
+
+    assert (pyproject.stat().st_mtime_ns, langgraph.stat().st_mtime_ns) == before
+    assert (pyproject.read_text(), langgraph.read_text()) == contents
+
+
+def test_register_cast_missing_langgraph_leaves_pyproject(tmp_path: Path) -> None:
+    pyproject, langgraph = _write_act_files(tmp_path, "", "")
+    original = pyproject.read_text()
+    langgraph.unlink()
+
+    with pytest.raises(RuntimeError):
+        register_cast(pyproject, langgraph, "new-cast", "new_cast")
+
+    assert pyproject.read_text() == original
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import bisect
+import copy
 import json
+import os
 import re
 import shutil
-import tempfile
 import tomllib  # Python 3.11+
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
-from cookiecutter.main import cookiecutter
+# cookiecutter (jinja2, requests, ...), tempfile and the process pool are
+# imported inside the functions that need them, so importing this module for
+# name handling stays cheap.
 
 # Constants
 CASTS_DIR = "casts"
@@ -20,6 +25,22 @@ CAST_PATH_PREFIX = "./casts/"
 PYPROJECT_FILE = "pyproject.toml"
 LANGGRAPH_FILE = "langgraph.json"
 ENCODING_UTF8 = "utf-8"
+MAX_RENDER_WORKERS = 8
+
+# Accepted Act/Cast name: starts with a letter; letters, digits, space, _ and -
+_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9 _-]*$")
+
+# Alphanumeric runs (words) of a name; separators are everything else
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# Opening line of a members array as written by _format_workspace_members
+_MEMBERS_OPEN = "members = [\n"
+
+# [tool.uv.workspace] header plus its optional members array
+_WORKSPACE_RE = re.compile(
+    r"(\[tool\.uv\.workspace\]\s*)(?:members\s*=\s*\[[^\]]*\])?",
+    re.DOTALL,
+)
 
 
 class Language(str, Enum):
@@ -54,15 +75,20 @@ class Language(str, Enum):
             return cls.ENGLISH
 
         val = value.strip().lower()
-        match val:
-            case "en" | "english":
-                return cls.ENGLISH
-            case "kr" | "korean" | "ko":
-                return cls.KOREAN
-            case _:
-                raise ValueError(
-                    f"Unsupported language: '{val}'. Please use 'en' or 'kr'."
-                )
+        language = _LANGUAGE_ALIASES.get(val)
+        if language is None:
+            raise ValueError(f"Unsupported language: '{val}'. Please use 'en' or 'kr'.")
+        return language
+
+
+# Accepted (lowercase) spellings for each Language
+_LANGUAGE_ALIASES: dict[str, Language] = {
+    "en": Language.ENGLISH,
+    "english": Language.ENGLISH,
+    "kr": Language.KOREAN,
+    "korean": Language.KOREAN,
+    "ko": Language.KOREAN,
+}
 
 
 @dataclass(slots=True, frozen=True)
@@ -85,12 +111,43 @@ class NameVariants:
 
 
 def build_name_variants(raw: str) -> NameVariants:
-    normalized = raw.strip()
+    """Build all name variants for an Act/Cast name.
+
+    Results are memoized per stripped input, so repeated lookups of the same
+    name during scaffolding return the same immutable instance.
+
+    Args:
+        raw: Name entered by the user (e.g., "My Project").
+
+    Returns:
+        NameVariants for the stripped input.
+
+    Raises:
+        ValueError: If the name is empty or has an invalid format.
+    """
+    return _build_name_variants_cached(raw.strip())
+
+
+@lru_cache(maxsize=256)
+def _build_name_variants_cached(normalized: str) -> NameVariants:
+    """Build name variants for an already stripped name (memoized)."""
     if not normalized:
         raise ValueError("Empty string cannot be used.")
 
+    # Fast path: already a lowercase ASCII word (e.g., "mycast"), nothing to split
+    if (
+        normalized.isascii()
+        and normalized.isalnum()
+        and normalized.islower()
+        and normalized[0].isalpha()
+    ):
+        title = normalized.title()
+        return NameVariants(
+            raw=normalized, slug=normalized, snake=normalized, title=title, pascal=title
+        )
+
     # Validate: only allow letters, numbers, spaces, hyphens, and underscores
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9 _-]*$", normalized):
+    if not _NAME_RE.match(normalized):
         raise ValueError(
             "Invalid name format. Name must:\n"
             "  - Start with a letter (a-z, A-Z)\n"
@@ -98,10 +155,13 @@ def build_name_variants(raw: str) -> NameVariants:
             "  - Not contain special characters like #, $, %, etc."
         )
 
-    slug = _normalize(normalized, "-")
-    snake = _normalize(normalized, "_")
-    title = normalized.replace("_", " ").replace("-", " ").title()
-    # PascalCase: remove spaces, hyphens, underscores and capitalize each word
+    # Split once into words and derive every variant from them
+    words = _WORD_RE.findall(normalized)
+    slug = "-".join(words).lower()
+    snake = slug.replace("-", "_")
+    # Spaces are word boundaries for str.title(), so one call covers all words
+    title = " ".join(words).title()
+    # PascalCase: capitalized words without separators
     pascal = title.replace(" ", "")
 
     if not slug or not snake:
@@ -119,28 +179,77 @@ def build_name_variants(raw: str) -> NameVariants:
     )
 
 
-def _normalize(value: str, sep: str) -> str:
-    """Normalize a string by replacing non-alphanumeric characters with separator.
+@lru_cache(maxsize=8)
+def _load_template_context(context_file: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a template's cookiecutter.json (memoized per file version).
 
     Args:
-        value: String to normalize.
-        sep: Separator character to use ("-" or "_").
+        context_file: Path to cookiecutter.json.
+        mtime_ns: Modification time of the file; part of the cache key so an
+            edited template is parsed again.
 
     Returns:
-        Normalized lowercase string with separator.
+        Template context as built by cookiecutter's ``generate_context``.
+        Shared between calls; callers must copy it before modifying it.
+    """
+    from cookiecutter.generate import generate_context
+
+    return generate_context(context_file=context_file)
+
+
+def _run_cookiecutter(
+    template_dir: Path, context: dict[str, Any], output_dir: Path
+) -> Path:
+    """Render a local cookiecutter template without interactive input.
 
-    Example:
-        >>> _normalize("My Project!", "-")
-        'my-project'
-        >>> _normalize("My Project!", "_")
-        'my_project'
+    Equivalent to ``cookiecutter(template_dir, no_input=True,
+    overwrite_if_exists=True)`` for a local template, but drives cookiecutter's
+    generation pipeline directly (the dependency is pinned below 3.0 for
+    that reason). This skips the per-call user config lookup,
+    repository resolution and replay file written to the user's home directory,
+    and parses cookiecutter.json only once per template version.
+
+    Args:
+        template_dir: Directory containing cookiecutter.json.
+        context: Cookiecutter context variables (extra context).
+        output_dir: Directory the project is rendered into.
+
+    Returns:
+        Path to the rendered project directory.
+
+    Raises:
+        FileNotFoundError: If cookiecutter.json is not found.
+        OSError: If rendering fails.
     """
-    cleaned = [ch.lower() if ch.isalnum() else sep for ch in value]
-    collapsed = "".join(cleaned)
-    # Remove consecutive separators
-    while sep * 2 in collapsed:
-        collapsed = collapsed.replace(sep * 2, sep)
-    return collapsed.strip(sep)
+    from cookiecutter.generate import apply_overwrites_to_context, generate_files
+    from cookiecutter.prompt import prompt_for_config
+
+    repo_dir = str(template_dir)
+    context_file = os.path.join(repo_dir, "cookiecutter.json")
+    # Overwrites and prompting mutate nested values, so work on a deep copy
+    full_context = copy.deepcopy(
+        _load_template_context(context_file, os.stat(context_file).st_mtime_ns)
+    )
+    apply_overwrites_to_context(full_context["cookiecutter"], context)
+    full_context["_cookiecutter"] = {
+        key: value
+        for key, value in full_context["cookiecutter"].items()
+        if not key.startswith("_")
+    }
+    variables = prompt_for_config(full_context, no_input=True)
+    variables["_template"] = repo_dir
+    variables["_output_dir"] = os.path.abspath(output_dir)
+    variables["_repo_dir"] = repo_dir
+    variables["_checkout"] = None
+    full_context["cookiecutter"] = variables
+
+    rendered_path = generate_files(
+        repo_dir=repo_dir,
+        context=full_context,
+        overwrite_if_exists=True,
+        output_dir=str(output_dir),
+    )
+    return Path(rendered_path)
 
 
 def render_cookiecutter_template(
@@ -167,6 +276,8 @@ def render_cookiecutter_template(
         FileNotFoundError: If template_dir doesn't exist.
         OSError: If rendering or moving files fails.
     """
+    import tempfile
+
     target_dir_exists = target_dir.exists()
     output_root = (
         target_dir.parent
@@ -175,16 +286,8 @@ def render_cookiecutter_template(
     )
 
     try:
-        rendered_path = cookiecutter(
-            str(template_dir),
-            no_input=True,
-            extra_context=context,
-            output_dir=str(output_root),
-            overwrite_if_exists=True,
-            directory=directory,
-        )
-
-        rendered_path = Path(rendered_path)
+        repo_dir = template_dir / directory if directory else template_dir
+        rendered_path = _run_cookiecutter(repo_dir, context, Path(output_root))
 
         # If target_dir exists (e.g., current directory), move contents into it
         if target_dir_exists:
@@ -197,9 +300,11 @@ def render_cookiecutter_template(
                         dest.unlink()
                 shutil.move(str(item), str(dest))
             shutil.rmtree(rendered_path)
-        # Otherwise, rename rendered directory to target
-        elif rendered_path.resolve() != target_dir.resolve():
-            rendered_path.rename(target_dir)
+        # Otherwise, rename rendered directory to target. cookiecutter returns
+        # an absolute path; absolute() (no syscall, unlike resolve()) keeps a
+        # relative target from triggering a rename of the directory onto itself.
+        elif rendered_path != target_dir.absolute():
+            os.replace(rendered_path, target_dir)
     finally:
         # Clean up temporary directory if we created one
         if target_dir_exists and Path(output_root).exists():
@@ -228,6 +333,25 @@ def _get_rendered_cast_dir(rendered_path: Path, cast_snake: str) -> Path:
     return source_cast_dir
 
 
+def _move_cast_to_target(source_dir: Path, target_dir: Path) -> None:
+    """Move a rendered cast directory to its destination.
+
+    Tries an atomic rename first and only falls back to a copying move when
+    the rename fails (e.g., source and target are on different filesystems).
+
+    Args:
+        source_dir: Rendered cast directory.
+        target_dir: Destination directory for the Cast.
+
+    Raises:
+        OSError: If moving files fails.
+    """
+    try:
+        os.replace(source_dir, target_dir)
+    except OSError:
+        shutil.move(str(source_dir), str(target_dir))
+
+
 def render_cookiecutter_cast_subproject(
     template_root: Path,
     target_dir: Path,
@@ -237,6 +361,13 @@ def render_cookiecutter_cast_subproject(
 ) -> None:
     """Render a Cast subproject from cookiecutter template.
 
+    An existing target_dir is replaced only after the new Cast has rendered
+    successfully. If moving the new Cast into place or post_process fails,
+    target_dir is put back as it was: the partially installed Cast is removed
+    and any previous Cast restored. Should the restore itself fail, the scratch
+    directory holding the previous Cast is kept and its path is added as a note
+    to the raised error.
+
     Args:
         template_root: Root path of the cookiecutter template.
         target_dir: Destination directory for the Cast.
@@ -247,51 +378,133 @@ def render_cookiecutter_cast_subproject(
         FileNotFoundError: If rendered cast directory is not found.
         OSError: If moving files fails.
     """
-    if target_dir.exists():
-        shutil.rmtree(target_dir)
+    import tempfile
 
     output_root = target_dir.parent
     project_slug = target_dir.name
+    output_root.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory(prefix="act_op_") as tmp_dir:
-        tmp_root = Path(tmp_dir)
-        rendered_path = cookiecutter(
-            str(template_root),
-            no_input=True,
-            extra_context={"project_dir": project_slug, **context},
-            output_dir=str(tmp_root),
-            overwrite_if_exists=True,
+    # Render one level above the target's parent: the final move stays a
+    # same-filesystem rename, and the scratch Act never lands inside the
+    # casts/ directory covered by the workspace member glob
+    tmp_root = Path(tempfile.mkdtemp(prefix=".act_op_", dir=output_root.parent))
+    keep_scratch = False
+    try:
+        rendered_path = _run_cookiecutter(
+            template_root, {"project_dir": project_slug, **context}, tmp_root
         )
-
-        rendered_path = Path(rendered_path)
         source_cast_dir = _get_rendered_cast_dir(rendered_path, context["cast_snake"])
 
-        output_root.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(source_cast_dir), str(target_dir))
+        # Swap the previous Cast out of the way (same-filesystem rename); it is
+        # removed with the scratch dir on success. Cast names never start with
+        # a dot.
+        previous: Path | None = tmp_root / ".previous"
+        try:
+            os.replace(target_dir, previous)
+        except FileNotFoundError:
+            previous = None
+
+        try:
+            _move_cast_to_target(source_cast_dir, target_dir)
+            if post_process:
+                post_process(rendered_path)
+        except BaseException as error:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            if previous is not None:
+                try:
+                    os.replace(previous, target_dir)
+                except OSError as restore_error:
+                    # Never delete the only remaining copy of the previous Cast
+                    keep_scratch = True
+                    error.add_note(
+                        f"The previous Cast could not be restored ({restore_error}); "
+                        f"it was kept at {previous}"
+                    )
+            raise
+    finally:
+        if not keep_scratch:
+            shutil.rmtree(tmp_root, ignore_errors=True)
+
+
+def render_many(specs: list[tuple[Path, Path, dict[str, Any]]]) -> None:
+    """Render several Cast subprojects concurrently.
+
+    Each render uses its own temporary directory and target, so they run in
+    parallel. cookiecutter changes the working directory while generating
+    files, which makes threads unsafe; renders run in worker processes instead,
+    at most one per CPU. With a single worker the renders run inline, sharing
+    this process's parsed template context and skipping pool startup.
+    Callers should update pyproject.toml / langgraph.json afterwards, serially.
+
+    On platforms that start worker processes with ``spawn`` (macOS, Windows),
+    the calling script must guard its entry point with
+    ``if __name__ == "__main__":``, as required by ProcessPoolExecutor.
+
+    Args:
+        specs: (template_root, target_dir, context) for each Cast, as accepted
+            by :func:`render_cookiecutter_cast_subproject`.
+
+    Raises:
+        ValueError: If two specs share the same target directory.
+        FileNotFoundError: If a rendered cast directory is not found.
+        OSError: If moving files fails.
+    """
+    targets = [target_dir for _, target_dir, _ in specs]
+    if len(set(targets)) != len(targets):
+        raise ValueError("Each Cast must be rendered into a distinct target_dir.")
+
+    workers = min(MAX_RENDER_WORKERS, len(specs), os.cpu_count() or 1)
+    if workers <= 1:
+        for template_root, target_dir, context in specs:
+            render_cookiecutter_cast_subproject(template_root, target_dir, context)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
 
-        if post_process:
-            post_process(rendered_path)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                render_cookiecutter_cast_subproject, template_root, target_dir, context
+            )
+            for template_root, target_dir, context in specs
+        ]
+        # Surface the first failure to the caller
+        for future in futures:
+            future.result()
 
 
-def _read_pyproject_members(pyproject_path: Path) -> list[str]:
-    """Read workspace members from pyproject.toml.
+def _read_pyproject(pyproject_path: Path) -> str:
+    """Read pyproject.toml content.
 
     Args:
         pyproject_path: Path to the pyproject.toml file.
 
     Returns:
-        List of workspace member paths.
+        Raw pyproject.toml content.
 
     Raises:
         RuntimeError: If pyproject.toml is not found.
     """
-    if not pyproject_path.exists():
-        raise RuntimeError(f"pyproject.toml not found: {pyproject_path}")
+    try:
+        return pyproject_path.read_text(encoding=ENCODING_UTF8)
+    except FileNotFoundError as error:
+        raise RuntimeError(f"pyproject.toml not found: {pyproject_path}") from error
+
 
-    content = pyproject_path.read_text(encoding=ENCODING_UTF8)
-    data = tomllib.loads(content)
-    workspace = data.get("tool", {}).get("uv", {}).get("workspace", {})
-    return list(workspace.get("members", []))
+def _extract_workspace_members(data: dict[str, Any]) -> list[str]:
+    """Extract workspace members from parsed pyproject.toml data.
+
+    Args:
+        data: Parsed pyproject.toml data.
+
+    Returns:
+        List of workspace member paths. This is the parsed list itself, not a
+        copy; callers own the freshly parsed data and may insert into it.
+    """
+    try:
+        return data["tool"]["uv"]["workspace"]["members"]
+    except KeyError:
+        return []
 
 
 def _format_workspace_members(members: list[str]) -> str:
@@ -303,8 +516,54 @@ def _format_workspace_members(members: list[str]) -> str:
     Returns:
         Formatted TOML members string.
     """
-    member_lines = ",\n".join(f'    "{member}"' for member in members)
-    return f"members = [\n{member_lines}\n]"
+    parts = [_MEMBERS_OPEN]
+    # Trailing commas are valid TOML and avoid a separate separator join
+    parts.extend(_format_member_line(member) for member in members)
+    parts.append("]")
+    return "".join(parts)
+
+
+def _format_member_line(member: str) -> str:
+    """Format a single workspace member line.
+
+    Args:
+        member: Workspace member path.
+
+    Returns:
+        Indented, quoted member line with a trailing comma and newline.
+    """
+    return f'    "{member}",\n'
+
+
+def _splice_workspace_member(
+    content: str,
+    workspace: re.Match[str],
+    members: list[str],
+    new_member: str,
+) -> str | None:
+    """Insert one line into a members array already in the written layout.
+
+    When the on-disk array is exactly what :func:`_format_workspace_members`
+    produces, only the new line needs to be inserted at its sorted position;
+    the result is identical to a full rewrite of the array.
+
+    Args:
+        content: Original pyproject.toml content.
+        workspace: Match of ``_WORKSPACE_RE`` in content.
+        members: Current (sorted) workspace members.
+        new_member: Workspace member path to add.
+
+    Returns:
+        Updated content, or None if the array has a different layout.
+    """
+    start = workspace.end(1)
+    if content[start : workspace.end()] != _format_workspace_members(members):
+        return None
+
+    index = bisect.bisect(members, new_member)
+    offset = start + len(_MEMBERS_OPEN)
+    offset += sum(len(_format_member_line(member)) for member in members[:index])
+    return content[:offset] + _format_member_line(new_member) + content[offset:]
 
 
 def _update_pyproject_content(content: str, formatted_members: str) -> str:
@@ -317,23 +576,56 @@ def _update_pyproject_content(content: str, formatted_members: str) -> str:
     Returns:
         Updated pyproject.toml content.
     """
-    workspace_section = "[tool.uv.workspace]"
-    pattern = re.compile(
-        r"(\[tool\.uv\.workspace\]\s*)(?:members\s*=\s*\[[^\]]*\])?",
-        re.DOTALL,
+    # Single scan: substitute in place, or learn that the section is missing
+    updated, count = _WORKSPACE_RE.subn(
+        lambda match: f"{match.group(1)}{formatted_members}",
+        content,
+        count=1,
     )
+    if count:
+        return updated
 
-    if workspace_section in content:
-        return pattern.sub(
-            lambda match: f"{match.group(1)}{formatted_members}",
-            content,
-            count=1,
-        )
-
-    block = f"\n\n{workspace_section}\n{formatted_members}\n"
+    block = f"\n\n[tool.uv.workspace]\n{formatted_members}\n"
     return content.rstrip() + block + "\n"
 
 
+def _add_workspace_member(content: str, new_member: str) -> str | None:
+    """Compute pyproject.toml content with a new workspace member.
+
+    The common no-op case (member already listed in the inline members array)
+    is answered from the raw text without parsing the TOML document, unless
+    the array contains comments (a commented-out entry is not a member). A new
+    member is spliced into a previously written array as a single line; other
+    layouts are rewritten in full.
+
+    Args:
+        content: Original pyproject.toml content.
+        new_member: Workspace member path to add.
+
+    Returns:
+        Updated content, or None if the file does not need to change.
+    """
+    workspace = _WORKSPACE_RE.search(content)
+    if workspace:
+        array = workspace.group(0)
+        if "#" not in array and f'"{new_member}"' in array:
+            return None
+
+    members = _extract_workspace_members(tomllib.loads(content))
+    if new_member in members:
+        return None
+
+    if workspace:
+        spliced = _splice_workspace_member(content, workspace, members, new_member)
+        if spliced is not None:
+            return spliced
+
+    bisect.insort(members, new_member)
+    formatted_members = _format_workspace_members(members)
+    updated_content = _update_pyproject_content(content, formatted_members)
+    return None if updated_content == content else updated_content
+
+
 def update_workspace_members(pyproject_path: Path, new_member: str) -> None:
     """Update the uv workspace members in pyproject.toml.
 
@@ -345,18 +637,10 @@ def update_workspace_members(pyproject_path: Path, new_member: str) -> None:
         RuntimeError: If pyproject.toml is not found.
         OSError: If file operations fail.
     """
-    members = _read_pyproject_members(pyproject_path)
-
-    if new_member in members:
-        return
-
-    members.append(new_member)
-    members.sort()
-
-    formatted_members = _format_workspace_members(members)
-    content = pyproject_path.read_text(encoding=ENCODING_UTF8)
-    updated_content = _update_pyproject_content(content, formatted_members)
-    pyproject_path.write_text(updated_content, encoding=ENCODING_UTF8)
+    content = _read_pyproject(pyproject_path)
+    updated_content = _add_workspace_member(content, new_member)
+    if updated_content is not None:
+        pyproject_path.write_text(updated_content, encoding=ENCODING_UTF8)
 
 
 def _build_graph_reference(cast_snake: str) -> str:
@@ -405,6 +689,79 @@ def select_drawkit_by_language(target_dir: Path, language: str) -> None:
         other_file.unlink()
 
 
+def _load_json_file(file_path: Path) -> dict[str, Any]:
+    """Load JSON data from a file.
+
+    Args:
+        file_path: Path to the JSON file.
+
+    Returns:
+        Parsed JSON data.
+
+    Raises:
+        json.JSONDecodeError: If the file is malformed.
+        OSError: If reading the file fails.
+    """
+    return json.loads(file_path.read_bytes())
+
+
+def _save_json_file(file_path: Path, data: dict[str, Any]) -> None:
+    """Write JSON data to a file with a trailing newline.
+
+    The payload is streamed to the file handle as 2-space indented UTF-8.
+
+    Args:
+        file_path: Path to the JSON file.
+        data: JSON-serializable data to write.
+
+    Raises:
+        OSError: If writing the file fails.
+    """
+    with file_path.open("w", encoding=ENCODING_UTF8) as file:
+        json.dump(data, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def _load_langgraph_data(langgraph_path: Path) -> dict[str, Any]:
+    """Load langgraph.json.
+
+    Args:
+        langgraph_path: Path to the langgraph.json file.
+
+    Returns:
+        Parsed langgraph.json payload.
+
+    Raises:
+        RuntimeError: If langgraph.json is not found.
+        json.JSONDecodeError: If langgraph.json is malformed.
+    """
+    try:
+        return _load_json_file(langgraph_path)
+    except FileNotFoundError as error:
+        raise RuntimeError(f"langgraph.json not found: {langgraph_path}") from error
+
+
+def _add_graph_entry(payload: dict[str, Any], cast_slug: str, cast_snake: str) -> bool:
+    """Register a cast graph in a langgraph.json payload.
+
+    Existing entries are never overwritten.
+
+    Args:
+        payload: Parsed langgraph.json payload (mutated in place).
+        cast_slug: Hyphenated cast name used as the graph key.
+        cast_snake: Snake-case cast name used in the graph path.
+
+    Returns:
+        True if the payload changed, False otherwise.
+    """
+    # Update graphs only (dependencies use wildcard patterns)
+    graphs = payload.setdefault("graphs", {})
+    if cast_slug in graphs:
+        return False
+    graphs[cast_slug] = _build_graph_reference(cast_snake)
+    return True
+
+
 def update_langgraph_registry(
     langgraph_path: Path,
     cast_slug: str,
@@ -425,17 +782,46 @@ def update_langgraph_registry(
         json.JSONDecodeError: If langgraph.json is malformed.
         OSError: If file operations fail.
     """
-    if not langgraph_path.exists():
-        raise RuntimeError(f"langgraph.json not found: {langgraph_path}")
+    payload = _load_langgraph_data(langgraph_path)
+    if _add_graph_entry(payload, cast_slug, cast_snake):
+        _save_json_file(langgraph_path, payload)
 
-    content = langgraph_path.read_text(encoding=ENCODING_UTF8)
-    payload: dict[str, Any] = json.loads(content)
 
-    # Update graphs only (dependencies use wildcard patterns)
-    graphs = payload.setdefault("graphs", {})
-    graph_reference = _build_graph_reference(cast_snake)
-    graphs.setdefault(cast_slug, graph_reference)
+def register_cast(
+    pyproject_path: Path,
+    langgraph_path: Path,
+    cast_slug: str,
+    cast_snake: str,
+    *,
+    member: str | None = None,
+) -> None:
+    """Register a Cast in both pyproject.toml and langgraph.json.
+
+    Both files are read and updated in memory before either is written, so a
+    missing or malformed file leaves the other untouched. Files that would not
+    change are not rewritten.
+
+    Args:
+        pyproject_path: Path to the pyproject.toml file.
+        langgraph_path: Path to the langgraph.json file.
+        cast_slug: Hyphenated cast name used as the graph key.
+        cast_snake: Snake-case cast name used in the graph path.
+        member: Workspace member path (defaults to "casts/<cast_snake>").
+
+    Raises:
+        RuntimeError: If pyproject.toml or langgraph.json is not found.
+        json.JSONDecodeError: If langgraph.json is malformed.
+        OSError: If file operations fail.
+    """
+    member = member or f"{CASTS_DIR}/{cast_snake}"
+
+    content = _read_pyproject(pyproject_path)
+    payload = _load_langgraph_data(langgraph_path)
+
+    updated_content = _add_workspace_member(content, member)
+    graph_added = _add_graph_entry(payload, cast_slug, cast_snake)
 
-    # Write updated content
-    updated_content = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
-    langgraph_path.write_text(updated_content, encoding=ENCODING_UTF8)
+    if updated_content is not None:
+        pyproject_path.write_text(updated_content, encoding=ENCODING_UTF8)
+    if graph_added:
+        _save_json_file(langgraph_path, payload)